@@ -2,6 +2,7 @@ import React from 'react';
 import ReactDOM from 'react-dom/client';
 import './index.css';
 import App from './App';
+import * as serviceWorkerRegistration from './serviceWorkerRegistration';
 import reportWebVitals from './reportWebVitals';
 
 const root = ReactDOM.createRoot(document.getElementById('root'));
@@ -11,6 +12,10 @@ root.render(
   </React.StrictMode>
 );
 
+// Cache the app shell so repeat visits start without waiting on the network,
+// and offer to switch to a new build as soon as one has been downloaded.
+serviceWorkerRegistration.register({ onUpdate: serviceWorkerRegistration.promptForUpdate });
+
 // If you want to start measuring performance in your app, pass a function
 // to log results (for example: reportWebVitals(console.log))
 // or send to an analytics endpoint. Learn more: https://bit.ly/CRA-vitals
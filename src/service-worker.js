@@ -0,0 +1,67 @@
+/* eslint-disable no-restricted-globals */
+
+// This service worker is compiled by react-scripts at build time: the
+// InjectManifest plugin replaces self.__WB_MANIFEST with the list of every
+// hashed asset webpack emitted. Precaching that list means repeat visits load
+// the app shell from the cache instead of the network.
+// See https://developers.google.com/web/tools/workbox/modules
+
+import { clientsClaim } from 'workbox-core';
+import { ExpirationPlugin } from 'workbox-expiration';
+import { precacheAndRoute, createHandlerBoundToURL } from 'workbox-precaching';
+import { registerRoute } from 'workbox-routing';
+import { StaleWhileRevalidate } from 'workbox-strategies';
+
+clientsClaim();
+
+// Precache all of the assets generated by the build process. Their URLs are
+// content-hashed, so they are served cache-first and only refetched when a
+// new service worker ships a new manifest.
+precacheAndRoute(self.__WB_MANIFEST);
+
+// Only same-origin requests are ever routed. Cross-origin traffic (the Gemini
+// API, Firestore, Firebase Auth) falls through to the network untouched.
+const isSameOrigin = (url) => url.origin === self.location.origin;
+
+// Set up App Shell-style routing, so that all navigation requests are
+// fulfilled with the precached index.html shell.
+const fileExtensionRegexp = new RegExp('/[^/?]+\\.[^/]+$');
+registerRoute(
+  ({ request, url }) => {
+    if (request.mode !== 'navigate') {
+      return false;
+    }
+    // Leave reserved paths such as /__/auth/handler to the network.
+    if (url.pathname.startsWith('/_')) {
+      return false;
+    }
+    // A navigation to a file (e.g. /robots.txt) is not an app route.
+    if (url.pathname.match(fileExtensionRegexp)) {
+      return false;
+    }
+    return true;
+  },
+  createHandlerBoundToURL(process.env.PUBLIC_URL + '/index.html')
+);
+
+// Static files copied from public/ are not hashed, so they are not part of
+// the precache manifest. Serve them from the cache immediately and refresh
+// the cached copy in the background.
+registerRoute(
+  ({ url }) =>
+    isSameOrigin(url) &&
+    /\.(?:png|ico|svg|json|txt)$/.test(url.pathname) &&
+    !url.pathname.endsWith('asset-manifest.json'),
+  new StaleWhileRevalidate({
+    cacheName: 'static-assets',
+    plugins: [new ExpirationPlugin({ maxEntries: 50 })],
+  })
+);
+
+// Lets the page tell a waiting service worker to take over, which is how the
+// update prompt in index.js activates a new version.
+self.addEventListener('message', (event) => {
+  if (event.data && event.data.type === 'SKIP_WAITING') {
+    self.skipWaiting();
+  }
+});
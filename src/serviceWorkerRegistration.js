@@ -0,0 +1,118 @@
+// This code registers the service worker built from src/service-worker.js.
+// It only runs in production builds; `npm start` never installs a worker.
+
+// The service worker lets repeat visits load the app shell from the cache
+// instead of waiting on the network. Updates are downloaded in the background
+// and only applied once every tab for this page has been closed, or when the
+// page asks the waiting worker to take over (see promptForUpdate below).
+
+const isLocalhost = Boolean(
+  window.location.hostname === 'localhost' ||
+    // [::1] is the IPv6 localhost address.
+    window.location.hostname === '[::1]' ||
+    // 127.0.0.0/8 are considered localhost for IPv4.
+    window.location.hostname.match(/^127(?:\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)){3}$/)
+);
+
+export function register(config) {
+  if (process.env.NODE_ENV === 'production' && 'serviceWorker' in navigator) {
+    // The URL constructor is available in all browsers that support SW.
+    const publicUrl = new URL(process.env.PUBLIC_URL, window.location.href);
+    if (publicUrl.origin !== window.location.origin) {
+      // Our service worker won't work if PUBLIC_URL is on a different origin
+      // from what our page is served on. This might happen if a CDN is used to
+      // serve assets; see https://github.com/facebook/create-react-app/issues/2374
+      return;
+    }
+
+    window.addEventListener('load', () => {
+      const swUrl = `${process.env.PUBLIC_URL}/service-worker.js`;
+
+      if (isLocalhost) {
+        // This is running on localhost. Let's check if a service worker still exists or not.
+        checkValidServiceWorker(swUrl, config);
+      } else {
+        // Is not localhost. Just register service worker
+        registerValidSW(swUrl, config);
+      }
+    });
+  }
+}
+
+function registerValidSW(swUrl, config) {
+  navigator.serviceWorker
+    .register(swUrl)
+    .then((registration) => {
+      // A worker may already be waiting from an earlier visit, e.g. when the
+      // prompt was dismissed or the update finished downloading in another
+      // tab. updatefound will not fire again for it, so offer it now.
+      if (registration.waiting && navigator.serviceWorker.controller) {
+        if (config && config.onUpdate) {
+          config.onUpdate(registration);
+        }
+      }
+      registration.onupdatefound = () => {
+        const installingWorker = registration.installing;
+        if (installingWorker == null) {
+          return;
+        }
+        installingWorker.onstatechange = () => {
+          // At this point, the updated precached content has been fetched,
+          // but the previous service worker will still serve the older
+          // content until all client tabs are closed.
+          if (installingWorker.state === 'installed' && navigator.serviceWorker.controller) {
+            if (config && config.onUpdate) {
+              config.onUpdate(registration);
+            }
+          }
+        };
+      };
+    })
+    .catch((error) => {
+      console.error('Error during service worker registration:', error);
+    });
+}
+
+function checkValidServiceWorker(swUrl, config) {
+  // Check if the service worker can be found. If it can't reload the page.
+  fetch(swUrl, {
+    headers: { 'Service-Worker': 'script' },
+  })
+    .then((response) => {
+      // Ensure service worker exists, and that we really are getting a JS file.
+      const contentType = response.headers.get('content-type');
+      if (
+        response.status === 404 ||
+        (contentType != null && contentType.indexOf('javascript') === -1)
+      ) {
+        // No service worker found. Probably a different app. Reload the page.
+        navigator.serviceWorker.ready.then((registration) => {
+          registration.unregister().then(() => {
+            window.location.reload();
+          });
+        });
+      } else {
+        // Service worker found. Proceed as normal.
+        registerValidSW(swUrl, config);
+      }
+    })
+    .catch(() => {
+      // Offline: the page is already being served by the existing worker.
+    });
+}
+
+// Asks the user whether to switch to a downloaded update right away. On
+// confirm, the waiting worker is told to take over and the page reloads once
+// it controls the page; otherwise the update applies when every tab closes.
+export function promptForUpdate(registration) {
+  const waitingWorker = registration.waiting;
+  if (!waitingWorker) {
+    return;
+  }
+  if (window.confirm('A new version of MelioConcept is available. Reload to update?')) {
+    navigator.serviceWorker.addEventListener('controllerchange', () => {
+      window.location.reload();
+    });
+    waitingWorker.postMessage({ type: 'SKIP_WAITING' });
+  }
+}
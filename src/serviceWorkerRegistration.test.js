@@ -0,0 +1,63 @@
+import { promptForUpdate } from './serviceWorkerRegistration';
+
+const fakeRegistration = () => ({ waiting: { postMessage: jest.fn() } });
+
+const originalLocation = window.location;
+let controllerChangeListeners;
+let reload;
+
+beforeEach(() => {
+  controllerChangeListeners = [];
+  Object.defineProperty(navigator, 'serviceWorker', {
+    configurable: true,
+    value: {
+      addEventListener: jest.fn((type, listener) => {
+        if (type === 'controllerchange') {
+          controllerChangeListeners.push(listener);
+        }
+      }),
+    },
+  });
+  reload = jest.fn();
+  // jsdom's Location cannot be spied on, so swap in a stub for the test.
+  delete window.location;
+  window.location = { reload };
+  jest.spyOn(window, 'confirm');
+});
+
+afterEach(() => {
+  jest.restoreAllMocks();
+  delete navigator.serviceWorker;
+  window.location = originalLocation;
+});
+
+test('activates the waiting worker and reloads when the user confirms', () => {
+  window.confirm.mockReturnValue(true);
+  const registration = fakeRegistration();
+
+  promptForUpdate(registration);
+
+  expect(registration.waiting.postMessage).toHaveBeenCalledWith({ type: 'SKIP_WAITING' });
+  expect(reload).not.toHaveBeenCalled();
+  controllerChangeListeners.forEach((listener) => listener());
+  expect(reload).toHaveBeenCalledTimes(1);
+});
+
+test('does nothing when the user declines', () => {
+  window.confirm.mockReturnValue(false);
+  const registration = fakeRegistration();
+
+  promptForUpdate(registration);
+
+  expect(registration.waiting.postMessage).not.toHaveBeenCalled();
+  expect(navigator.serviceWorker.addEventListener).not.toHaveBeenCalled();
+  expect(reload).not.toHaveBeenCalled();
+});
+
+test('does nothing when no worker is waiting', () => {
+  promptForUpdate({ waiting: null });
+
+  expect(window.confirm).not.toHaveBeenCalled();
+  expect(navigator.serviceWorker.addEventListener).not.toHaveBeenCalled();
+  expect(reload).not.toHaveBeenCalled();
+});